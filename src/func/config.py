@@ -0,0 +1,193 @@
+import configparser
+import logging
+import os
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, FrozenSet, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+LOG_LEVELS = {
+    "logging.DEBUG": logging.DEBUG,
+    "logging.INFO": logging.INFO,
+    "logging.WARNING": logging.WARNING,
+    "logging.ERROR": logging.ERROR,
+}
+
+# Values accepted as "feature disabled" for optional ID settings
+DISABLED_VALUES = {"", "false", "no", "off", "0"}
+
+
+@dataclass
+class LogRoute:
+    """Message logging sink and filters for a single guild"""
+
+    guild_id: int
+    include_channels: FrozenSet[int] = frozenset()
+    exclude_channels: FrozenSet[int] = frozenset()
+    exclude_authors: FrozenSet[int] = frozenset()
+    ignore_bots: bool = False
+    # Resolved from the guild name on first use, see MyClient._route_log_file
+    log_file: Optional[str] = None
+
+
+@dataclass
+class BotConfig:
+    """Validated bot configuration, parsed once at startup"""
+
+    discord_token: str
+    client_id: str
+    client_secret: str
+    streams: List[str]
+    channel_id: Optional[int] = None
+    message: str = "{name} is live!"
+    leet_channel_id: Optional[int] = None
+    leet_user: str = ""
+    logging_routes: Dict[int, LogRoute] = field(default_factory=dict)
+    logging_enabled: bool = True
+    log_level: int = logging.ERROR
+    project_root: str = PROJECT_ROOT
+
+
+@dataclass
+class StartupTimer:
+    """Records how long each startup phase took"""
+
+    started: float = field(default_factory=time.perf_counter)
+    phases: Dict[str, float] = field(default_factory=dict)
+    last: float = 0.0
+
+    def mark(self, phase: str) -> None:
+        """Record the end of a phase (only the first mark per phase counts)"""
+        if phase in self.phases:
+            return
+        now = time.perf_counter() - self.started
+        self.phases[phase] = now
+        self.last = max(self.last, now)
+
+    def summary(self) -> str:
+        """Format phases in completion order with their offset from start"""
+        ordered = sorted(self.phases.items(), key=lambda item: item[1])
+        parts = [f"{phase}={offset * 1000:.0f}ms" for phase, offset in ordered]
+        return f"Startup {self.last * 1000:.0f}ms: " + ", ".join(parts)
+
+
+def find_config_path(project_root: str = PROJECT_ROOT) -> str:
+    """Look for config.ini in project root, then in config/ subdirectory"""
+    config_path = os.path.join(project_root, "config.ini")
+    if not os.path.exists(config_path):
+        config_path = os.path.join(project_root, "config", "config.ini.dist")
+    return config_path
+
+
+def _optional_id(section: configparser.SectionProxy, key: str) -> Optional[int]:
+    """Parse an optional Discord ID, treating empty/false-like values as unset"""
+    value = section.get(key, "").strip()
+    if value.lower() in DISABLED_VALUES:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {key} ID in config: {value!r}")
+
+
+def _id_set(section: configparser.SectionProxy, key: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of Discord IDs, empty/false-like means none"""
+    ids = set()
+    for value in section.get(key, "").split(","):
+        value = value.strip()
+        if value.lower() in DISABLED_VALUES:
+            continue
+        try:
+            ids.add(int(value))
+        except ValueError:
+            raise ValueError(f"Invalid {key} ID in config: {value!r}")
+    return frozenset(ids)
+
+
+def _log_route(
+    section: configparser.SectionProxy, guild_id: int, defaults: LogRoute
+) -> LogRoute:
+    """Parse logging filters for a guild, falling back to the given defaults"""
+    route = replace(defaults, guild_id=guild_id)
+    for key in ("include_channels", "exclude_channels", "exclude_authors"):
+        if key in section:
+            setattr(route, key, _id_set(section, key))
+    if "ignore_bots" in section:
+        route.ignore_bots = section.getboolean("ignore_bots")
+    return route
+
+
+def _load_log_routes(config: configparser.ConfigParser) -> Dict[int, LogRoute]:
+    """Build log routes from [DISCORD] defaults and [LOGGING.<guild_id>] sections"""
+    discord_config = config["DISCORD"]
+    defaults = LogRoute(
+        guild_id=0,
+        include_channels=_id_set(discord_config, "logging_include_channels"),
+        exclude_channels=_id_set(discord_config, "logging_exclude_channels"),
+        exclude_authors=_id_set(discord_config, "logging_exclude_authors"),
+        ignore_bots=discord_config.getboolean("logging_ignore_bots", fallback=False),
+    )
+    routes = {
+        guild_id: replace(defaults, guild_id=guild_id)
+        for guild_id in _id_set(discord_config, "logging")
+    }
+
+    # Per-guild sections override the defaults and enable logging for the guild
+    for name in config.sections():
+        if not name.startswith("LOGGING."):
+            continue
+        try:
+            guild_id = int(name[len("LOGGING.") :])
+        except ValueError:
+            raise ValueError(f"Invalid guild ID in config section: [{name}]")
+        routes[guild_id] = _log_route(config[name], guild_id, defaults)
+
+    return routes
+
+
+def build_log_routes(config: BotConfig) -> Dict[int, LogRoute]:
+    """Copy the guild ID -> LogRoute table used by on_message"""
+    return {
+        guild_id: replace(route) for guild_id, route in config.logging_routes.items()
+    }
+
+
+def load_config(config_path: Optional[str] = None) -> BotConfig:
+    """Parse and validate config.ini into a BotConfig"""
+    config = configparser.ConfigParser()
+    config_path = config_path or find_config_path()
+    try:
+        with open(config_path) as fh:
+            config.read_file(fh)
+    except Exception as e:
+        raise FileNotFoundError(f"Cannot find config file: {e}")
+
+    if "DISCORD" not in config or "TWITCH" not in config:
+        raise ValueError("Section for config not found, please check your config!")
+
+    discord_config = config["DISCORD"]
+    twitch_config = config["TWITCH"]
+
+    if "token" not in discord_config:
+        raise ValueError("Discord config not found, check config.ini!")
+
+    streams = []
+    for stream in twitch_config.get("streams", "").split(","):
+        stream = stream.strip()
+        if stream and stream not in streams:
+            streams.append(stream)
+
+    return BotConfig(
+        discord_token=discord_config["token"],
+        client_id=twitch_config.get("client_id", ""),
+        client_secret=twitch_config.get("client_secret", ""),
+        streams=streams,
+        channel_id=_optional_id(discord_config, "channel"),
+        message=discord_config.get("message", "{name} is live!"),
+        leet_channel_id=_optional_id(discord_config, "leet_channel"),
+        leet_user=discord_config.get("leet_user", "").strip(),
+        logging_routes=_load_log_routes(config),
+        logging_enabled=config.getboolean("DEFAULT", "ENABLE_LOGGING", fallback=True),
+        log_level=LOG_LEVELS.get(config["DEFAULT"].get("LOG_LEVEL", ""), logging.ERROR),
+    )
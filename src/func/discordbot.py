@@ -1,8 +1,7 @@
 import time
 from datetime import datetime
-import configparser
 import os
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 import discord
 from discord.ext import tasks
@@ -13,33 +12,34 @@ import aiofiles
 import aiofiles.os
 import asyncio
 
+from func.config import (
+    BotConfig,
+    LogRoute,
+    StartupTimer,
+    build_log_routes,
+    load_config,
+)
+from func.metadata import MetadataCache
+
 
 class MyClient(discord.Client):
-    def __init__(self, logging_enabled: bool = True, *args, **kwargs):
+    def __init__(
+        self,
+        logging_enabled: bool = True,
+        *args,
+        config: Optional[BotConfig] = None,
+        startup: Optional[StartupTimer] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         self.logging_enabled = logging_enabled
         self.logging = logging.getLogger(__name__) if logging_enabled else None
 
-        self.config = configparser.ConfigParser()
-        try:
-            # Look for config.ini in project root, then in config/ subdirectory
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            config_path = os.path.join(project_root, "config.ini")
-            if not os.path.exists(config_path):
-                config_path = os.path.join(project_root, "config", "config.ini.dist")
-            with open(config_path) as fh:
-                self.config.read_file(fh)
-            fh.close()
-        except Exception as e:
-            raise FileNotFoundError(f"Cannot find config file: {e}")
-
-        if "DISCORD" not in self.config or "TWITCH" not in self.config:
-            raise ValueError("Section for config not found, please check your config!")
-
-        # Performance: Cache frequently accessed config values
-        self.discord_config = self.config["DISCORD"]
-        self.twitch_config = self.config["TWITCH"]
+        # Performance: Reuse the config parsed by main.py instead of re-reading it
+        self.config = config or load_config()
+        self.startup = startup or StartupTimer()
+        self.startup_reported = False
 
         # Stream monitoring attributes
         self.hour = ""
@@ -51,7 +51,7 @@ class MyClient(discord.Client):
         self.live = False
         self.dimensions = {"{width}": "500", "{height}": "281"}
         self.thumbnail = False
-        self.list_streams = self.twitch_config["streams"].split(",")
+        self.list_streams = self.config.streams
         self.twitch_user_id = ""
         self.leet = False
 
@@ -60,25 +60,45 @@ class MyClient(discord.Client):
 
         # Performance: Reuse HTTP session
         self.http_session: Optional[aiohttp.ClientSession] = None
+        self.twitch_init_task: Optional[asyncio.Task] = None
+
+        # Live notifications found before the gateway is ready
+        self.pending_notifications: Dict[str, Dict[str, Any]] = {}
+
+        # Performance: Persistent LRU+TTL caches for game and profile metadata
+        cache_dir = os.path.join(self.config.project_root, "data", "cache")
+        self.game_cache = MetadataCache(
+            os.path.join(cache_dir, "games.json"), ttl=7 * 86400
+        )
+        self.user_cache = MetadataCache(os.path.join(cache_dir, "users.json"))
+        self.game_cache.load()
+        self.user_cache.load()
+
+        # Seed login -> ID lookups from persisted profiles
+        for user_id, entry in self.user_cache.entries.items():
+            login = entry["data"].get("login")
+            if login:
+                self.user_id_cache[login] = user_id
 
         # Message logging setup (only if enabled)
-        self.message_logging_enabled = (
-            self.logging_enabled and self.discord_config.get("logging", "") != ""
+        # Performance: Precomputed guild ID -> LogRoute table, empty when disabled
+        self.log_routes: Dict[int, LogRoute] = (
+            build_log_routes(self.config) if self.logging_enabled else {}
         )
+        self.message_logging_enabled = bool(self.log_routes)
+        self.worker_task = None
 
         if self.message_logging_enabled:
             self.queue = asyncio.Queue()
-            self.worker_task = None
             # Ensure server_log directory exists
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            server_log_dir = os.path.join(project_root, "data", "server_log")
+            server_log_dir = os.path.join(
+                self.config.project_root, "data", "server_log"
+            )
             os.makedirs(server_log_dir, exist_ok=True)
 
-        # Initialize streams dictionary
+        # Initialize streams dictionary (names are stripped and deduplicated)
         for stream in self.list_streams:
-            stream = stream.strip()  # Performance: strip whitespace once
-            if stream:  # Skip empty strings
-                self.streams[stream] = {"name": stream, "id": 0, "live": False}
+            self.streams[stream] = {"name": stream, "id": 0, "live": False}
 
     def _log_info(self, message: str) -> None:
         """Safe logging method that only logs if logging is enabled"""
@@ -100,23 +120,45 @@ class MyClient(discord.Client):
         if self.logging_enabled and self.logging:
             self.logging.error(message)
 
-    async def setup_hook(self) -> None:
-        """Initialize async components"""
+    def _report_startup(self) -> None:
+        """Log the startup timing breakdown once polling and gateway are up"""
+        if self.startup_reported:
+            return
+        if "first_poll" in self.startup.phases and "ready" in self.startup.phases:
+            self.startup_reported = True
+            self._log_info(self.startup.summary())
+
+    async def login(self, token: str) -> None:
+        """Log in to Discord while fetching Twitch token and user IDs"""
         # Create persistent HTTP session for better performance
         self.http_session = aiohttp.ClientSession()
 
+        # Performance: Twitch setup runs concurrently with the Discord login
+        self.twitch_init_task = asyncio.create_task(self._initialize_twitch_data())
+
+        # Start polling now, before_loop only waits for the Twitch setup and
+        # notifications are buffered until the gateway is ready
+        self.background_twitch.start()
+
+        await super().login(token)
+
+    async def setup_hook(self) -> None:
+        """Initialize async components"""
+        self.startup.mark("discord_login")
+
         # Only start message logging worker if enabled
         if self.message_logging_enabled:
             self.worker_task = asyncio.create_task(self.worker())
 
-        # Get initial bearer token and user IDs
-        await self._initialize_twitch_data()
-
-        # Start the background task for Twitch monitoring
-        self.background_twitch.start()
-
     async def close(self) -> None:
         """Clean shutdown"""
+        self.background_twitch.cancel()
+
+        if self.twitch_init_task and not self.twitch_init_task.done():
+            self.twitch_init_task.cancel()
+
+        await self._save_metadata_caches()
+
         if self.http_session:
             await self.http_session.close()
 
@@ -133,11 +175,14 @@ class MyClient(discord.Client):
         """Initialize Twitch bearer token and user IDs"""
         try:
             self.bearer_token = await self.twitch_get_bearer(
-                self.twitch_config["client_id"], self.twitch_config["client_secret"]
+                self.config.client_id, self.config.client_secret
             )
+            self.startup.mark("twitch_token")
+            # Resolved from the persisted profile cache when possible
             await self.twitch_get_user_ids(
-                self.bearer_token, self.streams, self.twitch_config["client_id"]
+                self.bearer_token, self.streams, self.config.client_id
             )
+            self.startup.mark("twitch_user_ids")
         except Exception as e:
             self._log_error(f"Failed to initialize Twitch data: {e}")
 
@@ -149,7 +194,7 @@ class MyClient(discord.Client):
         if not self.bearer_token or current_time >= (self.bearer_token_expires - 300):
             self._log_info("Refreshing Twitch bearer token...")
             self.bearer_token = await self.twitch_get_bearer(
-                self.twitch_config["client_id"], self.twitch_config["client_secret"]
+                self.config.client_id, self.config.client_secret
             )
 
         return self.bearer_token
@@ -197,16 +242,17 @@ class MyClient(discord.Client):
 
         headers = {"Authorization": f"Bearer {bearer}", "Client-Id": client_id}
 
+        # Update cached streams first, even if others still need a lookup
+        for stream in streams:
+            if stream in self.user_id_cache:
+                streams[stream]["id"] = self.user_id_cache[stream]
+
         # Performance: Batch process multiple usernames in one request
         uncached_streams = [
             stream for stream in streams.keys() if stream not in self.user_id_cache
         ]
 
         if not uncached_streams:
-            # All streams are cached, update from cache
-            for stream in streams:
-                if stream in self.user_id_cache:
-                    streams[stream]["id"] = self.user_id_cache[stream]
             return
 
         # Build batch request URL (Twitch API supports multiple login names)
@@ -237,6 +283,8 @@ class MyClient(discord.Client):
                     user_id = user_data["id"]
 
                     self.user_id_cache[login] = user_id
+                    # Profile data comes for free with the ID lookup
+                    self.user_cache.put(user_id, self._user_metadata(user_data))
                     if login in streams:
                         streams[login]["id"] = user_id
                         self._log_debug(f"Got User ID for {login}: {user_id}")
@@ -275,6 +323,135 @@ class MyClient(discord.Client):
             self._log_error(f"Exception getting stream info: {e}")
             self.stream_data = []
 
+    @staticmethod
+    def _user_metadata(user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a Helix user object to the fields needed for embeds"""
+        return {
+            "login": user_data.get("login", ""),
+            "display_name": user_data.get("display_name", ""),
+            "profile_image_url": user_data.get("profile_image_url", ""),
+        }
+
+    @staticmethod
+    def _game_metadata(game_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a Helix game object to the fields needed for embeds"""
+        return {
+            "name": game_data.get("name", ""),
+            "box_art_url": game_data.get("box_art_url", ""),
+        }
+
+    async def twitch_get_metadata(
+        self, bearer: str, client_id: str, game_ids: List[str], user_ids: List[str]
+    ) -> None:
+        """Resolve uncached game and user metadata with batched Helix calls"""
+        batches = []
+
+        # Performance: Helix accepts up to 100 IDs per request
+        for endpoint, cache, ids in (
+            ("games", self.game_cache, game_ids),
+            ("users", self.user_cache, user_ids),
+        ):
+            missing = cache.missing(ids)
+            for i in range(0, len(missing), 100):
+                batches.append((endpoint, cache, missing[i : i + 100]))
+
+        if not batches:
+            return
+
+        self._log_debug(f"Resolving metadata in {len(batches)} batch(es)")
+        headers = {"Authorization": f"Bearer {bearer}", "Client-Id": client_id}
+        results = await asyncio.gather(
+            *(self._twitch_get_metadata_batch(*batch, headers) for batch in batches)
+        )
+
+        # Token expired: refresh once and retry only the rejected batches
+        failed = [batch for batch, status in zip(batches, results) if status == 401]
+        if failed:
+            self._log_info("Token expired, refreshing...")
+            self.bearer_token = None
+            new_bearer = await self._ensure_valid_token()
+            headers = dict(headers, Authorization=f"Bearer {new_bearer}")
+            await asyncio.gather(
+                *(self._twitch_get_metadata_batch(*batch, headers) for batch in failed)
+            )
+
+    async def _twitch_get_metadata_batch(
+        self,
+        endpoint: str,
+        cache: MetadataCache,
+        ids: List[str],
+        headers: Dict[str, str],
+    ) -> int:
+        """Fetch one batch of /helix/games or /helix/users and cache the results
+
+        Returns the HTTP status, or 0 if the request failed.
+        """
+        id_params = "&".join([f"id={item_id}" for item_id in ids])
+        url = f"https://api.twitch.tv/helix/{endpoint}?{id_params}"
+        reduce = self._game_metadata if endpoint == "games" else self._user_metadata
+
+        try:
+            async with self.http_session.get(url, headers=headers) as r:
+                if r.status == 401:  # Token expired, retried by the caller
+                    return r.status
+                elif r.status != 200:
+                    error_text = await r.text()
+                    self._log_error(
+                        f"Failed to get {endpoint} metadata: {r.status} - {error_text}"
+                    )
+                    return r.status
+
+                js = await r.json()
+                for item in js.get("data", []):
+                    cache.put(item["id"], reduce(item))
+                return r.status
+
+        except Exception as e:
+            self._log_error(f"Exception getting {endpoint} metadata: {e}")
+            return 0
+
+    async def _save_metadata_caches(self) -> None:
+        """Persist metadata caches, ignoring write errors"""
+        for cache in (self.game_cache, self.user_cache):
+            try:
+                await cache.save()
+            except Exception as e:
+                self._log_warning(f"Failed to save metadata cache: {e}")
+
+    def _build_stream_embed(
+        self, stream_name: str, stream_data: Dict[str, Any]
+    ) -> Optional[discord.Embed]:
+        """Build a live embed from cached metadata, None if nothing is cached"""
+        game = self.game_cache.get(stream_data.get("game_id", ""))
+        user = self.user_cache.get(stream_data.get("user_id", ""))
+        if not game and not user:
+            return None
+
+        stream_url = f"https://www.twitch.tv/{stream_name}"
+        embed = discord.Embed(
+            title=stream_data["title"], url=stream_url, colour=discord.Colour.purple()
+        )
+
+        # Cached entries may come from a hand-edited file, so keys are optional
+        if user:
+            embed.set_author(
+                name=user.get("display_name") or stream_name,
+                url=stream_url,
+                icon_url=user.get("profile_image_url") or None,
+            )
+
+        game_name = stream_data.get("game_name") or (game.get("name") if game else "")
+        if game_name:
+            embed.add_field(name="Game", value=game_name)
+        box_art_url = game.get("box_art_url") if game else ""
+        if box_art_url:
+            box_art_url = box_art_url.replace("{width}", "144").replace(
+                "{height}", "192"
+            )
+            embed.set_thumbnail(url=box_art_url)
+
+        return embed
+
     async def get_stream_thumb(self, url: str, stream: str) -> bool:
         """Download stream thumbnail with improved error handling and performance"""
         try:
@@ -283,10 +460,9 @@ class MyClient(discord.Client):
             async with self.http_session.get(url) as r:
                 if r.status == 200:
                     # Save thumbnail in data/images subdirectory
-                    project_root = os.path.dirname(
-                        os.path.dirname(os.path.dirname(__file__))
+                    images_dir = os.path.join(
+                        self.config.project_root, "data", "images"
                     )
-                    images_dir = os.path.join(project_root, "data", "images")
                     # Ensure images directory exists
                     os.makedirs(images_dir, exist_ok=True)
                     file_path = os.path.join(images_dir, f"{stream}_thumb.jpg")
@@ -324,7 +500,7 @@ class MyClient(discord.Client):
 
         if self.hour == "13" and self.minute == "37" and not self.leet:
             try:
-                leet_user = self.discord_config.get("leet_user", "").strip()
+                leet_user = self.config.leet_user
                 message = f"1337 <@{leet_user}>" if leet_user else "1337"
 
                 await channel.send(message)
@@ -338,20 +514,32 @@ class MyClient(discord.Client):
     async def background_twitch(self):
         """Main background task for Twitch monitoring"""
         try:
-            # Send leet message if configured
-            leet_channel = self.discord_config.get("leet_channel", "").strip()
-            if leet_channel:
-                await self.sendleet(int(leet_channel))
+            # Send leet message if configured (channels exist once ready)
+            if self.config.leet_channel_id and self.is_ready():
+                await self.sendleet(self.config.leet_channel_id)
 
-            # Process each stream
+            # Poll every stream first so metadata can be resolved in one batch
+            polled = []
             for stream_name, stream_info in self.streams.items():
-                await self._process_stream(stream_name, stream_info)
+                stream_data = await self._poll_stream(stream_name, stream_info)
+                polled.append((stream_name, stream_info, stream_data))
+
+            await self._enrich_live_streams(polled)
+
+            # Process each stream
+            for stream_name, stream_info, stream_data in polled:
+                await self._process_stream(stream_name, stream_info, stream_data)
+
+            self.startup.mark("first_poll")
+            self._report_startup()
 
         except Exception as e:
             self._log_error(f"Error in background task: {e}")
 
-    async def _process_stream(self, stream_name: str, stream_info: Dict) -> None:
-        """Process a single stream for live status"""
+    async def _poll_stream(
+        self, stream_name: str, stream_info: Dict
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch current stream data for a single stream"""
         self._log_info(f"Processing stream: {stream_name}")
 
         try:
@@ -360,34 +548,85 @@ class MyClient(discord.Client):
 
             # Get stream information
             await self.twitch_get_stream(
-                bearer, self.twitch_config["client_id"], stream_info["id"]
+                bearer, self.config.client_id, stream_info["id"]
+            )
+            return self.stream_data
+
+        except Exception as e:
+            self._log_error(f"Error polling stream {stream_name}: {e}")
+            return None
+
+    async def _enrich_live_streams(self, polled: List) -> None:
+        """Resolve game and profile metadata for streams that just went live"""
+        live = [
+            stream_data[0]
+            for _, stream_info, stream_data in polled
+            if stream_data and not stream_info["live"]
+        ]
+        if not live:
+            return
+
+        try:
+            bearer = await self._ensure_valid_token()
+            await self.twitch_get_metadata(
+                bearer,
+                self.config.client_id,
+                [data.get("game_id", "") for data in live],
+                [data.get("user_id", "") for data in live],
             )
+            await self._save_metadata_caches()
+        except Exception as e:
+            self._log_warning(f"Failed to enrich stream metadata: {e}")
+
+    async def _process_stream(
+        self,
+        stream_name: str,
+        stream_info: Dict,
+        stream_data: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """Process a single stream for live status"""
+        if stream_data is None:
+            return
 
-            channel_id = self.discord_config.get("channel", "").strip()
+        try:
+            channel_id = self.config.channel_id
             if not channel_id:
                 self._log_warning("No Discord channel configured")
                 return
 
-            channel = self.get_channel(int(channel_id))
+            if len(stream_data) == 0:
+                self._log_info(f"{stream_name} is not streaming...")
+                stream_info["live"] = False
+                self.pending_notifications.pop(stream_name, None)
+                return
+
+            if stream_info["live"]:
+                return
+
+            # Buffer until the gateway is ready and channels are cached
+            if not self.is_ready():
+                self._log_debug(f"Buffering live notification for {stream_name}")
+                self.pending_notifications[stream_name] = stream_data[0]
+                return
+
+            channel = self.get_channel(channel_id)
             if not channel:
                 self._log_error(f"Could not find Discord channel: {channel_id}")
                 return
 
-            # Check if stream went live
-            if len(self.stream_data) > 0 and not stream_info["live"]:
-                await self._handle_stream_live(stream_name, stream_info, channel)
-            elif len(self.stream_data) == 0:
-                self._log_info(f"{stream_name} is not streaming...")
-                stream_info["live"] = False
+            # Stream went live, a direct send supersedes any buffered one
+            self.pending_notifications.pop(stream_name, None)
+            await self._handle_stream_live(
+                stream_name, stream_info, stream_data[0], channel
+            )
 
         except Exception as e:
             self._log_error(f"Error processing stream {stream_name}: {e}")
 
     async def _handle_stream_live(
-        self, stream_name: str, stream_info: Dict, channel
+        self, stream_name: str, stream_info: Dict, stream_data: Dict, channel
     ) -> None:
         """Handle when a stream goes live"""
-        stream_data = self.stream_data[0]
         self._log_info(f"Stream {stream_name} went live: {stream_data['title']}")
 
         # Create thumbnail URL
@@ -395,6 +634,10 @@ class MyClient(discord.Client):
         for placeholder, dimension in self.dimensions.items():
             image_url = image_url.replace(placeholder, dimension)
 
+        # Mark as live before any await so a concurrent poll or flush can't
+        # send the same notification again; reset below if sending fails
+        stream_info["live"] = True
+
         # Download thumbnail with timeout
         thumbnail_downloaded = False
         try:
@@ -405,43 +648,75 @@ class MyClient(discord.Client):
             self._log_warning(f"Thumbnail download timed out for {stream_name}")
 
         # Build message
-        message_template = self.discord_config.get("message", "{name} is live!")
+        message_template = self.config.message
         message = message_template.replace("{name}", stream_name).replace(
             "{user}", stream_name
         )
-        message += f"\n**{stream_data['title']}**\n"
-        message += f"https://www.twitch.tv/{stream_name}"
+
+        thumb_name = f"{stream_name}_thumb.jpg"
 
         # Send message
         try:
+            # Performance: Embed only uses cached metadata, no extra round trips
+            embed = self._build_stream_embed(stream_name, stream_data)
+            if embed is None:
+                message += f"\n**{stream_data['title']}**\n"
+                message += f"https://www.twitch.tv/{stream_name}"
+
             if thumbnail_downloaded:
-                project_root = os.path.dirname(
-                    os.path.dirname(os.path.dirname(__file__))
-                )
-                images_dir = os.path.join(project_root, "data", "images")
-                file_path = os.path.join(images_dir, f"{stream_name}_thumb.jpg")
-                await channel.send(
-                    message, suppress_embeds=True, file=discord.File(file_path)
-                )
+                images_dir = os.path.join(self.config.project_root, "data", "images")
+                file_path = os.path.join(images_dir, thumb_name)
+                if embed is not None:
+                    embed.set_image(url=f"attachment://{thumb_name}")
+                    await channel.send(
+                        message, embed=embed, file=discord.File(file_path)
+                    )
+                else:
+                    await channel.send(
+                        message, suppress_embeds=True, file=discord.File(file_path)
+                    )
                 # Clean up thumbnail file
                 try:
                     await aiofiles.os.remove(file_path)
                 except Exception:
                     pass  # Ignore cleanup errors
+            elif embed is not None:
+                await channel.send(message, embed=embed)
             else:
                 await channel.send(message, suppress_embeds=True)
 
-            stream_info["live"] = True
             self._log_info(f"Sent live notification for {stream_name}")
 
         except Exception as e:
+            stream_info["live"] = False
             self._log_error(f"Failed to send live notification for {stream_name}: {e}")
 
     @background_twitch.before_loop
     async def background_twitch_before(self):
         """Setup before starting the background loop"""
         self._log_debug("Initializing background task...")
-        await self.wait_until_ready()
+        # Performance: Only wait for Twitch setup, not for the gateway
+        if self.twitch_init_task:
+            await self.twitch_init_task
+
+    async def _flush_pending_notifications(self) -> None:
+        """Send live notifications buffered before the gateway was ready"""
+        if not self.pending_notifications:
+            return
+
+        channel = self.get_channel(self.config.channel_id)
+        if not channel:
+            self._log_error(f"Could not find Discord channel: {self.config.channel_id}")
+            return
+
+        pending = self.pending_notifications
+        self.pending_notifications = {}
+        for stream_name, stream_data in pending.items():
+            stream_info = self.streams[stream_name]
+            if not stream_info["live"]:
+                await self._handle_stream_live(
+                    stream_name, stream_info, stream_data, channel
+                )
 
     async def worker(self) -> None:
         """Message logging worker (only runs if logging enabled)"""
@@ -449,62 +724,103 @@ class MyClient(discord.Client):
             return
 
         while True:
+            batch = [await self.queue.get()]
             try:
-                message, log_file = await self.queue.get()
-
-                # Build log entry
-                attachments_text = ""
-                if message.attachments:
-                    attachments_text = " Attachments: " + " ".join(
-                        attachment.url for attachment in message.attachments
-                    )
-
-                log_entry = (
-                    f"[{message.created_at}] {message.channel.name} "
-                    f"{message.author.display_name}({message.author.name}): "
-                    f"{message.content}{attachments_text}\n"
-                )
-
-                # Write to log file
-                async with aiofiles.open(log_file, mode="a+", encoding="utf-8") as logs:
-                    await logs.write(log_entry)
-
-                self.queue.task_done()
+                # Performance: Drain the queue so each file is opened once per batch
+                while len(batch) < 500 and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+
+                # A bad message or file only drops its own entries
+                entries: Dict[str, List[str]] = {}
+                for message, log_file in batch:
+                    try:
+                        entry = self._format_log_entry(message)
+                    except Exception as e:
+                        self._log_error(f"Failed to format logged message: {e}")
+                        continue
+                    entries.setdefault(log_file, []).append(entry)
+
+                # Write to log files
+                for log_file, lines in entries.items():
+                    try:
+                        async with aiofiles.open(
+                            log_file, mode="a+", encoding="utf-8"
+                        ) as logs:
+                            await logs.write("".join(lines))
+                    except Exception as e:
+                        self._log_error(f"Failed to write message log {log_file}: {e}")
 
             except Exception as e:
                 self._log_error(f"Error in message logging worker: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    @staticmethod
+    def _format_log_entry(message: Any) -> str:
+        """Build a single message log line"""
+        attachments_text = ""
+        if message.attachments:
+            attachments_text = " Attachments: " + " ".join(
+                attachment.url for attachment in message.attachments
+            )
+
+        return (
+            f"[{message.created_at}] {message.channel.name} "
+            f"{message.author.display_name}({message.author.name}): "
+            f"{message.content}{attachments_text}\n"
+        )
+
+    def _route_log_file(self, route: LogRoute, guild: Any) -> str:
+        """Resolve and cache the log file path for a guild route"""
+        route.log_file = os.path.join(
+            self.config.project_root,
+            "data",
+            "server_log",
+            f"{guild.name}_{guild.id}_messages.txt",
+        )
+        return route.log_file
 
     async def on_message(self, message: Any) -> None:
         """Handle incoming messages"""
-        # Don't log own messages
-        if message.author.id == self.user.id:
-            self._log_debug("Ignoring own message")
+        # Performance: Single dict lookup rejects messages from unlogged guilds
+        guild = message.guild
+        route = self.log_routes.get(guild.id) if guild else None
+        if route is None:
             return
 
-        # Only process message logging if enabled
-        if not self.message_logging_enabled:
+        # Threads match the filters of their parent channel as well
+        channel = message.channel
+        channel_id = channel.id
+        parent_id = getattr(channel, "parent_id", None)
+        if (
+            channel_id in route.exclude_channels
+            or parent_id in route.exclude_channels
+            or (
+                route.include_channels
+                and channel_id not in route.include_channels
+                and parent_id not in route.include_channels
+            )
+        ):
             return
 
-        # Check if message is from the configured guild
-        logging_guild_id = self.discord_config.get("logging", "").strip()
-        if not logging_guild_id:
+        # Don't log own messages
+        author = message.author
+        if (
+            author.id == self.user.id
+            or author.id in route.exclude_authors
+            or (route.ignore_bots and author.bot)
+        ):
             return
 
-        try:
-            if message.guild and message.guild.id == int(logging_guild_id):
-                project_root = os.path.dirname(
-                    os.path.dirname(os.path.dirname(__file__))
-                )
-                log_file = os.path.join(
-                    project_root,
-                    "data",
-                    "server_log",
-                    f"{message.guild.name}_messages.txt",
-                )
-                await self.queue.put((message, log_file))
-                self._log_debug(f"Queued message for logging: {message.id}")
-        except (ValueError, TypeError) as e:
-            self._log_error(f"Invalid logging guild ID configuration: {e}")
+        log_file = route.log_file or self._route_log_file(route, guild)
+        self.queue.put_nowait((message, log_file))
+
+    async def on_guild_update(self, before: Any, after: Any) -> None:
+        """Re-resolve the log file of a routed guild after a rename"""
+        route = self.log_routes.get(after.id)
+        if route and before.name != after.name:
+            route.log_file = None
 
     async def on_ready(self) -> None:
         """Bot ready event"""
@@ -516,5 +832,9 @@ class MyClient(discord.Client):
         await self.change_presence(status=discord.Status.online, activity=game)
 
         self._log_info(f"Monitoring {len(self.streams)} streams")
+
+        self.startup.mark("ready")
+        self._report_startup()
+        await self._flush_pending_notifications()
         if self.logging_enabled:
             self._log_debug(f"Streams: {list(self.streams.keys())}")
@@ -0,0 +1,84 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiofiles
+
+
+class MetadataCache:
+    """LRU cache with per-entry TTL that can be persisted to a JSON file"""
+
+    def __init__(self, path: str, max_entries: int = 512, ttl: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Performance: OrderedDict gives O(1) LRU reordering and eviction
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.dirty = False
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached data for key, or None if missing or expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        if time.time() >= entry["expires"]:
+            del self.entries[key]
+            self.dirty = True
+            return None
+
+        self.entries.move_to_end(key)
+        return entry["data"]
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store data for key and evict the least recently used entries"""
+        self.entries[key] = {"data": data, "expires": time.time() + self.ttl}
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def missing(self, keys: Iterable[str]) -> List[str]:
+        """Return the keys that are not cached (or expired), without duplicates"""
+        return [key for key in dict.fromkeys(keys) if key and self.get(key) is None]
+
+    def load(self) -> None:
+        """Load persisted entries, dropping expired ones"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                stored = json.load(fh)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(stored, dict):
+            return
+
+        now = time.time()
+        for key, entry in stored.items():
+            # Skip malformed entries so a damaged file is ignored, not fatal
+            if (
+                isinstance(entry, dict)
+                and isinstance(entry.get("data"), dict)
+                and isinstance(entry.get("expires"), (int, float))
+                and entry["expires"] > now
+            ):
+                self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def save(self) -> None:
+        """Persist entries to disk if they changed since the last save"""
+        if not self.dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        async with aiofiles.open(tmp_path, mode="w", encoding="utf-8") as fh:
+            await fh.write(json.dumps(self.entries))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
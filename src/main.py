@@ -1,44 +1,26 @@
 #!/usr/bin/python3
 import discord
 import logging
-import configparser
+from func.config import StartupTimer, load_config
 from func.discordbot import MyClient
 from logging.handlers import TimedRotatingFileHandler
 import os
 
-log_level_info = {
-    "logging.DEBUG": logging.DEBUG,
-    "logging.INFO": logging.INFO,
-    "logging.WARNING": logging.WARNING,
-    "logging.ERROR": logging.ERROR,
-}
-
 if __name__ == "__main__":
-    config = configparser.ConfigParser()
-    # Look for config.ini in project root, then in config/ subdirectory
-    project_root = os.path.dirname(os.path.dirname(__file__))
-    config_path = os.path.join(project_root, "config.ini")
-    if not os.path.exists(config_path):
-        config_path = os.path.join(project_root, "config", "config.ini.dist")
-    with open(config_path) as fh:
-        config.read_file(fh)
-    fh.close()
-
-    if "DISCORD" not in config or ("token" not in config["DISCORD"]):
-        raise ValueError("Discord config not found, check config.ini!")
+    startup = StartupTimer()
 
-    # Check if logging is enabled
-    logging_enabled = config.getboolean("DEFAULT", "ENABLE_LOGGING", fallback=True)
+    # Parse and validate config once, the client reuses it
+    config = load_config()
+    startup.mark("config")
 
-    if logging_enabled:
+    if config.logging_enabled:
         # Ensure logs directory exists
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        logs_dir = os.path.join(project_root, "logs")
+        logs_dir = os.path.join(config.project_root, "logs")
         os.makedirs(logs_dir, exist_ok=True)
 
         logging.basicConfig(
             format="%(asctime)s [%(filename)s:%(lineno)s - %(funcName)20s() ] [%(levelname)s] %(message)s",
-            level=log_level_info.get(config["DEFAULT"]["LOG_LEVEL"], logging.ERROR),
+            level=config.log_level,
             encoding="utf-8",
             handlers=[
                 logging.StreamHandler(),
@@ -58,8 +40,14 @@ if __name__ == "__main__":
             level=logging.CRITICAL,
             handlers=[logging.StreamHandler()],
         )
+    startup.mark("logging")
 
     intents = discord.Intents.default()
     intents.message_content = True
-    client = MyClient(intents=intents, logging_enabled=logging_enabled)
-    client.run(config["DISCORD"]["token"])
+    client = MyClient(
+        intents=intents,
+        logging_enabled=config.logging_enabled,
+        config=config,
+        startup=startup,
+    )
+    client.run(config.discord_token)